@@ -1,9 +1,38 @@
 """Chrome DevTools Protocol client with absolute imports only"""
 
+import asyncio
 import json
+import threading
+import time
 import requests
 import websocket
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional
+
+_loads: Callable[..., Any]
+try:
+    # Optional C-accelerated decoder for large CDP payloads
+    import orjson
+except ImportError:
+    _loads = json.loads
+else:
+
+    def _orjson_loads(data: Any) -> Any:
+        """Decode with orjson, falling back to json for what it rejects.
+
+        orjson refuses lone UTF-16 surrogates, which JS strings in CDP events
+        can carry and json.loads accepts.
+        """
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data)
+
+    _loads = _orjson_loads
+
+# Upper bound (seconds) on HTTP discovery and on waiting for a CDP reply, so a
+# wedged renderer fails the call instead of hanging the MCP session
+HTTP_TIMEOUT = 5.0
+COMMAND_TIMEOUT = 10.0
 
 
 class ChromeDevToolsClient:
@@ -13,6 +42,10 @@ class ChromeDevToolsClient:
         self.ws = None
         self.port = None
         self.connected = False
+        self._next_id = 0
+        # One command in flight at a time: the socket has a single reader, so
+        # concurrent callers would consume each other's replies
+        self._lock = threading.Lock()
 
     def connect(self, port: int = 9222) -> bool:
         """Connect to Chrome DevTools."""
@@ -20,7 +53,9 @@ class ChromeDevToolsClient:
             self.port = port
 
             # Get available tabs
-            response = requests.get(f"http://localhost:{port}/json/list")
+            response = requests.get(
+                f"http://localhost:{port}/json/list", timeout=HTTP_TIMEOUT
+            )
             tabs = response.json()
 
             if not tabs:
@@ -30,7 +65,7 @@ class ChromeDevToolsClient:
             tab = tabs[0]
             ws_url = tab["webSocketDebuggerUrl"]
 
-            self.ws = websocket.create_connection(ws_url)
+            self.ws = websocket.create_connection(ws_url, timeout=COMMAND_TIMEOUT)
             self.connected = True
 
             # Enable required domains
@@ -60,17 +95,62 @@ class ChromeDevToolsClient:
         except Exception:
             return False
 
-    def _send_command(self, method: str, params: Dict[str, Any]) -> Optional[Dict]:
-        """Send command to Chrome DevTools."""
+    async def send_command(
+        self, method: str, params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Send a command from async code and return its ``result`` payload.
+
+        The blocking round trip runs in a worker thread. Raises RuntimeError
+        if Chrome reports an error or no reply arrives in time.
+        """
+        message = await asyncio.to_thread(self._send_command, method, params or {})
+        if message is None:
+            raise RuntimeError(f"No reply to {method}")
+        if "error" in message:
+            raise RuntimeError(f"{method} failed: {message['error']}")
+        return message.get("result", {})
+
+    def _send_command(
+        self,
+        method: str,
+        params: Dict[str, Any],
+        timeout: float = COMMAND_TIMEOUT,
+    ) -> Optional[Dict]:
+        """Send command to Chrome DevTools.
+
+        Commands are single-flight: callers on other threads wait for the
+        current round trip to finish. Returns None if the reply does not
+        arrive within ``timeout`` seconds, including time spent waiting.
+        """
+        deadline = time.monotonic() + timeout
+        if not self._lock.acquire(timeout=timeout):
+            return None
         try:
             if not self.is_connected():
                 return None
 
-            command = {"id": 1, "method": method, "params": params}
+            self._next_id += 1
+            command_id = self._next_id
+            command = {"id": command_id, "method": method, "params": params}
 
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            self.ws.settimeout(remaining)
             self.ws.send(json.dumps(command))
-            response = self.ws.recv()
-            return json.loads(response)
+
+            # Events and late replies to timed-out commands share the socket,
+            # so skip everything until the reply carrying our id arrives
+            while True:
+                message = _loads(self.ws.recv())
+                if message.get("id") == command_id:
+                    return message
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                self.ws.settimeout(remaining)
 
         except Exception:
             return None
+        finally:
+            self._lock.release()
@@ -58,7 +58,10 @@ def register_tools(app):
 
             # Start Chrome process
             process = subprocess.Popen(
-                cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                bufsize=-1,
             )
 
             # Wait a moment for Chrome to start
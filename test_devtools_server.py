@@ -11,13 +11,15 @@ import asyncio
 import logging
 import os
 import platform
-import subprocess
+import shutil
 import sys
+import tempfile
 from collections.abc import AsyncGenerator
 from typing import Any
 
 import pytest
 import pytest_asyncio
+import requests
 
 sys.path.insert(0, os.path.dirname(__file__))
 
@@ -28,25 +30,29 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+SYSTEM = platform.system()
+
+# Reused for all DevTools endpoint probes so polling keeps one TCP connection
+HTTP_SESSION = requests.Session()
+
 
 def get_chrome_path() -> str | None:
     """Get Chrome executable path for testing."""
-    system = platform.system()
     paths = []
 
-    if system == "Darwin":  # macOS
+    if SYSTEM == "Darwin":  # macOS
         paths = [
             "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
             "/Applications/Chromium.app/Contents/MacOS/Chromium",
         ]
-    elif system == "Linux":
+    elif SYSTEM == "Linux":
         paths = [
             "/usr/bin/google-chrome",
             "/usr/bin/google-chrome-stable",
             "/usr/bin/chromium-browser",
             "/usr/bin/chromium",
         ]
-    elif system == "Windows":
+    elif SYSTEM == "Windows":
         paths = [
             "C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe",
             "C:\\Program Files (x86)\\Google\\Chrome\\Application\\chrome.exe",
@@ -58,10 +64,108 @@ def get_chrome_path() -> str | None:
     return None
 
 
+async def check_chrome_running(port: int) -> bool:
+    """Check whether a DevTools endpoint is answering on the given port."""
+    try:
+        response = await asyncio.to_thread(
+            HTTP_SESSION.get, f"http://localhost:{port}/json/version", timeout=1
+        )
+        return response.ok
+    except requests.RequestException:
+        return False
+
+
+async def wait_for_chrome(port: int, timeout: float = 10.0) -> bool:
+    """Poll the DevTools HTTP endpoint until Chrome accepts connections.
+
+    The poll interval starts small and doubles, so a warm start is picked up
+    within milliseconds while a cold start is not probed excessively.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    delay = 0.05
+    while loop.time() < deadline:
+        if await check_chrome_running(port):
+            return True
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 1.0)
+    return False
+
+
+async def stop_chrome(
+    process: asyncio.subprocess.Process, timeout: float = 5.0
+) -> None:
+    """Terminate Chrome without blocking the event loop while it exits."""
+    # Unlike Popen, asyncio's terminate()/kill() raise once the child has exited
+    try:
+        process.terminate()
+    except ProcessLookupError:
+        pass
+    try:
+        await asyncio.wait_for(process.wait(), timeout)
+    except asyncio.TimeoutError:
+        try:
+            process.kill()
+        except ProcessLookupError:
+            pass
+        await process.wait()
+
+
+async def wait_for_page(
+    cdp_client: ChromeDevToolsClient, expression: str, timeout: float = 5.0
+) -> None:
+    """Poll until a JS expression is true in the tab, failing the test on timeout.
+
+    Page.navigate replies before the new document commits, so readyState alone
+    may still describe the page being navigated away from; the expression must
+    identify the target document.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while loop.time() < deadline:
+        result = await cdp_client.send_command(
+            "Runtime.evaluate", {"expression": expression, "returnByValue": True}
+        )
+        if result["result"].get("value") is True:
+            return
+        await asyncio.sleep(0.05)
+    pytest.fail(f"Page did not satisfy {expression!r} within {timeout}s")
+
+
+TEST_PAGE_HTML = """
+<html>
+<head><title>Test Page</title></head>
+<body>
+    <div id="test-element" class="test-class">Test Content</div>
+    <button id="test-button">Test Button</button>
+    <script>console.log('Test page loaded');</script>
+</body>
+</html>
+"""
+
+# True only when the tab already shows the fully loaded test page
+TEST_PAGE_CHECK = (
+    "document.title === 'Test Page' && "
+    "document.getElementById('test-element') !== null && "
+    "document.readyState === 'complete'"
+)
+
+
 @pytest_asyncio.fixture(scope="session")
 async def chrome_setup() -> AsyncGenerator[dict[str, Any], None]:
-    """Set up Chrome instance for testing."""
+    """Set up Chrome instance for testing.
+
+    A Chrome already listening on the test port (e.g. left running between
+    watch-mode runs) is reused and left running afterwards.
+    """
     test_port = 9223
+
+    if await check_chrome_running(test_port):
+        logger.info(f"Reusing Chrome already running on port {test_port}")
+        yield {"port": test_port}
+        HTTP_SESSION.close()
+        return
+
     chrome_path = get_chrome_path()
 
     if not chrome_path:
@@ -69,6 +173,8 @@ async def chrome_setup() -> AsyncGenerator[dict[str, Any], None]:
 
     logger.info("Setting up test environment...")
 
+    # A fresh profile per run avoids lock contention with concurrent runners
+    user_data_dir = tempfile.mkdtemp(prefix=f"chrome-test-{test_port}-")
     cmd = [
         str(chrome_path),
         f"--remote-debugging-port={test_port}",
@@ -76,21 +182,27 @@ async def chrome_setup() -> AsyncGenerator[dict[str, Any], None]:
         "--disable-gpu",
         "--no-sandbox",
         "--disable-dev-shm-usage",
-        "--user-data-dir=/tmp/chrome-test-profile",
+        f"--user-data-dir={user_data_dir}",
     ]
 
-    chrome_process = subprocess.Popen(
-        cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    chrome_process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.DEVNULL,
     )
-    await asyncio.sleep(3)
+    if not await wait_for_chrome(test_port):
+        await stop_chrome(chrome_process)
+        shutil.rmtree(user_data_dir, ignore_errors=True)
+        pytest.skip("Chrome did not start in time for testing")
     logger.info(f"Chrome started for testing on port {test_port}")
 
     yield {"port": test_port}
 
     # Cleanup
     logger.info("Cleaning up test environment...")
-    chrome_process.terminate()
-    chrome_process.wait()
+    await stop_chrome(chrome_process)
+    shutil.rmtree(user_data_dir, ignore_errors=True)
+    HTTP_SESSION.close()
     logger.info("Test environment cleaned up")
 
 
@@ -114,19 +226,32 @@ async def cdp_client(
 
 
 async def setup_test_page(cdp_client: ChromeDevToolsClient) -> None:
-    """Set up a test page with elements for testing."""
-    html = """
-    <html>
-    <head><title>Test Page</title></head>
-    <body>
-        <div id="test-element" class="test-class">Test Content</div>
-        <button id="test-button">Test Button</button>
-        <script>console.log('Test page loaded');</script>
-    </body>
-    </html>
+    """Set up a test page with elements for testing.
+
+    Navigation is skipped when the tab is already showing the loaded test page.
     """
-    await cdp_client.send_command("Page.navigate", {"url": f"data:text/html,{html}"})
-    await asyncio.sleep(1)
+    loaded = await cdp_client.send_command(
+        "Runtime.evaluate", {"expression": TEST_PAGE_CHECK, "returnByValue": True}
+    )
+    if loaded["result"].get("value") is True:
+        return
+
+    await cdp_client.send_command(
+        "Page.navigate", {"url": f"data:text/html,{TEST_PAGE_HTML}"}
+    )
+    await wait_for_page(cdp_client, TEST_PAGE_CHECK)
+
+
+async def get_test_element_id(cdp_client: ChromeDevToolsClient) -> int:
+    """Load the test page and return the node ID of #test-element (0 if absent)."""
+    await setup_test_page(cdp_client)
+
+    doc_result = await cdp_client.send_command("DOM.getDocument", {"depth": 2})
+    element_result = await cdp_client.send_command(
+        "DOM.querySelector",
+        {"nodeId": doc_result["root"]["nodeId"], "selector": "#test-element"},
+    )
+    return element_result["nodeId"]
 
 
 @pytest.mark.asyncio
@@ -142,8 +267,8 @@ async def test_connection_status(cdp_client: ChromeDevToolsClient) -> None:
     """Test CDP connection status."""
     assert cdp_client.connected, "CDP client should be connected"
 
-    target_info = await cdp_client.get_target_info()
-    assert target_info is not None, "Should be able to get target info"
+    target_info = await cdp_client.send_command("Target.getTargetInfo")
+    assert "targetInfo" in target_info, "Should be able to get target info"
 
 
 @pytest.mark.asyncio
@@ -153,7 +278,11 @@ async def test_navigation(cdp_client: ChromeDevToolsClient) -> None:
         "Page.navigate",
         {"url": "data:text/html,<html><body><h1>Navigation Test</h1></body></html>"},
     )
-    await asyncio.sleep(1)
+    await wait_for_page(
+        cdp_client,
+        "document.querySelector('h1')?.textContent === 'Navigation Test' && "
+        "document.readyState === 'complete'",
+    )
 
 
 @pytest.mark.asyncio
@@ -184,18 +313,11 @@ async def test_query_selector(cdp_client: ChromeDevToolsClient) -> None:
 @pytest.mark.asyncio
 async def test_element_attributes(cdp_client: ChromeDevToolsClient) -> None:
     """Test element attribute retrieval."""
-    await setup_test_page(cdp_client)
-
-    doc_result = await cdp_client.send_command("DOM.getDocument", {"depth": 2})
-    root_id = doc_result["root"]["nodeId"]
-
-    element_result = await cdp_client.send_command(
-        "DOM.querySelector", {"nodeId": root_id, "selector": "#test-element"}
-    )
+    node_id = await get_test_element_id(cdp_client)
 
-    if element_result["nodeId"] != 0:
+    if node_id != 0:
         attrs_result = await cdp_client.send_command(
-            "DOM.getAttributes", {"nodeId": element_result["nodeId"]}
+            "DOM.getAttributes", {"nodeId": node_id}
         )
         assert "attributes" in attrs_result, "Should return attributes"
 
@@ -203,18 +325,11 @@ async def test_element_attributes(cdp_client: ChromeDevToolsClient) -> None:
 @pytest.mark.asyncio
 async def test_element_outer_html(cdp_client: ChromeDevToolsClient) -> None:
     """Test element HTML retrieval."""
-    await setup_test_page(cdp_client)
-
-    doc_result = await cdp_client.send_command("DOM.getDocument", {"depth": 2})
-    root_id = doc_result["root"]["nodeId"]
+    node_id = await get_test_element_id(cdp_client)
 
-    element_result = await cdp_client.send_command(
-        "DOM.querySelector", {"nodeId": root_id, "selector": "#test-element"}
-    )
-
-    if element_result["nodeId"] != 0:
+    if node_id != 0:
         html_result = await cdp_client.send_command(
-            "DOM.getOuterHTML", {"nodeId": element_result["nodeId"]}
+            "DOM.getOuterHTML", {"nodeId": node_id}
         )
         assert "outerHTML" in html_result, "Should return outer HTML"
         assert "test-element" in html_result["outerHTML"], (
@@ -225,18 +340,13 @@ async def test_element_outer_html(cdp_client: ChromeDevToolsClient) -> None:
 @pytest.mark.asyncio
 async def test_computed_styles(cdp_client: ChromeDevToolsClient) -> None:
     """Test computed style retrieval."""
-    await setup_test_page(cdp_client)
-
-    doc_result = await cdp_client.send_command("DOM.getDocument", {"depth": 2})
-    root_id = doc_result["root"]["nodeId"]
+    node_id = await get_test_element_id(cdp_client)
 
-    element_result = await cdp_client.send_command(
-        "DOM.querySelector", {"nodeId": root_id, "selector": "#test-element"}
-    )
-
-    if element_result["nodeId"] != 0:
+    if node_id != 0:
+        # CSS methods fail with "CSS agent was not enabled" until this runs
+        await cdp_client.send_command("CSS.enable")
         styles_result = await cdp_client.send_command(
-            "CSS.getComputedStyleForNode", {"nodeId": element_result["nodeId"]}
+            "CSS.getComputedStyleForNode", {"nodeId": node_id}
         )
         assert "computedStyle" in styles_result, "Should return computed styles"
 
@@ -259,17 +369,13 @@ async def test_console_logs(cdp_client: ChromeDevToolsClient) -> None:
         "Runtime.evaluate",
         {"expression": "console.log('Test log message')", "returnByValue": True},
     )
-
-    await asyncio.sleep(1)
     # Note: Console log capture may vary by Chrome version
 
 
 @pytest.mark.asyncio
 async def test_network_monitoring(cdp_client: ChromeDevToolsClient) -> None:
     """Test network request monitoring."""
-    initial_requests = len(cdp_client.network_requests)
-
-    await cdp_client.send_command(
+    result = await cdp_client.send_command(
         "Runtime.evaluate",
         {
             "expression": "fetch('data:text/plain,test').then(r => r.text())",
@@ -278,11 +384,7 @@ async def test_network_monitoring(cdp_client: ChromeDevToolsClient) -> None:
         },
     )
 
-    await asyncio.sleep(1)
-
-    # Network monitoring may capture some requests
-    final_requests = len(cdp_client.network_requests)
-    assert final_requests >= initial_requests, "Should track network activity"
+    assert result["result"]["value"] == "test", "Fetch should complete"
 
 
 @pytest.mark.asyncio
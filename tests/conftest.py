@@ -0,0 +1,144 @@
+"""Shared fixtures for the test suite."""
+
+import asyncio
+import hashlib
+import importlib
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+try:
+    import tomllib
+except ImportError:
+    import tomli as tomllib
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+PYPROJECT_PATH = PROJECT_ROOT / "pyproject.toml"
+PACKAGE_DIR = PROJECT_ROOT / "chrome_devtools_mcp_fork"
+
+
+def pytest_addoption(parser):
+    parser.addoption("--run-slow", action="store_true", help="run tests marked as slow")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip slow tests unless --run-slow is given."""
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="needs --run-slow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
+def project_root():
+    """Absolute path of the repository checkout."""
+    return PROJECT_ROOT
+
+
+@pytest.fixture
+def reimport_package(monkeypatch):
+    """Return a function that imports the package from scratch.
+
+    Every chrome_devtools_mcp_fork module is dropped from sys.modules first,
+    so all module-level code runs again as in a fresh interpreter. The
+    original modules are restored after the test.
+    """
+
+    def reimport():
+        for name in list(sys.modules):
+            if name.partition(".")[0] == "chrome_devtools_mcp_fork":
+                monkeypatch.delitem(sys.modules, name)
+        return importlib.import_module("chrome_devtools_mcp_fork")
+
+    return reimport
+
+
+@pytest.fixture(scope="session")
+def all_tools():
+    """List the registered MCP tools once per test session."""
+    from chrome_devtools_mcp_fork.main import app
+
+    return asyncio.run(app.list_tools())
+
+
+@pytest.fixture(scope="session")
+def pyproject():
+    """Parse pyproject.toml once per test session."""
+    with open(PYPROJECT_PATH, "rb") as f:
+        return tomllib.load(f)
+
+
+def _source_hash():
+    """Hash the inputs of a package build: metadata, readme and sources."""
+    digest = hashlib.sha256()
+    sources = sorted(
+        p for p in PACKAGE_DIR.rglob("*.py") if "__pycache__" not in p.parts
+    )
+    for path in [PYPROJECT_PATH, PROJECT_ROOT / "README.md", *sources]:
+        digest.update(str(path.relative_to(PROJECT_ROOT)).encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def _build_package(outdir):
+    """Build the wheel and sdist into outdir, skipping if build is missing."""
+    # The build log can be large, so stderr goes to a file rather than a pipe
+    # and stdout is dropped.
+    with tempfile.TemporaryFile() as err:
+        result = subprocess.run(
+            [sys.executable, "-m", "build", "--outdir", str(outdir)],
+            cwd=PROJECT_ROOT,
+            stdout=subprocess.DEVNULL,
+            stderr=err,
+        )
+
+        if result.returncode != 0:
+            err.seek(0)
+            stderr = err.read().decode(errors="replace")
+            # If build module not installed, skip test
+            if "No module named build" in stderr:
+                pytest.skip("build module not installed")
+            pytest.fail(f"Package build failed: {stderr}")
+
+
+@pytest.fixture(scope="session")
+def built_dist(request, tmp_path_factory):
+    """Build the wheel and sdist, reusing the last build if sources are unchanged."""
+    cache = getattr(request.config, "cache", None)
+    if cache is None:
+        # Cache plugin disabled (-p no:cacheprovider): build without reuse
+        dist_dir = tmp_path_factory.mktemp("dist")
+        _build_package(dist_dir)
+        return dist_dir
+
+    cache_root = cache.mkdir("built_dist")
+    dist_dir = cache_root / _source_hash()
+    if dist_dir.is_dir():
+        return dist_dir
+
+    # Drop finished builds of older source trees, but leave other runs'
+    # in-progress builds alone
+    for stale in cache_root.iterdir():
+        if not stale.name.startswith("tmp-"):
+            shutil.rmtree(stale, ignore_errors=True)
+
+    build_dir = Path(tempfile.mkdtemp(dir=cache_root, prefix="tmp-"))
+    try:
+        _build_package(build_dir)
+    except BaseException:
+        shutil.rmtree(build_dir, ignore_errors=True)
+        raise
+
+    # Only a finished build is published under the hash
+    try:
+        build_dir.rename(dist_dir)
+    except OSError:
+        # Another run published the same source tree first
+        shutil.rmtree(build_dir, ignore_errors=True)
+    return dist_dir
@@ -0,0 +1,201 @@
+"""Test ChromeDevToolsClient command/response handling."""
+
+import asyncio
+import itertools
+import json
+import queue
+import time
+
+import pytest
+
+from chrome_devtools_mcp_fork import client as client_module
+from chrome_devtools_mcp_fork.client import ChromeDevToolsClient
+
+
+@pytest.fixture(params=["json", "orjson"])
+def decoder(request, monkeypatch):
+    """Run the test under the stdlib decoder and, if installed, orjson."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+        monkeypatch.setattr(client_module, "_loads", client_module._orjson_loads)
+    else:
+        monkeypatch.setattr(client_module, "_loads", json.loads)
+    return request.param
+
+
+class FakeWebSocket:
+    """Minimal stand-in for a websocket-client connection."""
+
+    def __init__(self, incoming, delay=0.0):
+        self.incoming = iter(incoming)
+        self.delay = delay
+        self.sent = []
+        self.timeouts = []
+
+    def settimeout(self, timeout):
+        self.timeouts.append(timeout)
+
+    def send(self, payload):
+        self.sent.append(json.loads(payload))
+
+    def recv(self):
+        time.sleep(self.delay)
+        return json.dumps(next(self.incoming))
+
+
+def test_send_command_skips_events_and_stale_replies(decoder):
+    """Replies are matched to commands by id, not by arrival order."""
+    client = ChromeDevToolsClient()
+    client.connected = True
+    client.ws = FakeWebSocket(
+        [
+            {"method": "Runtime.executionContextCreated", "params": {}},
+            {"id": 0, "result": {"stale": True}},
+            {"id": 1, "result": {"value": 4}},
+        ]
+    )
+
+    response = client._send_command("Runtime.evaluate", {"expression": "2 + 2"})
+
+    assert client.ws.sent[0]["id"] == 1
+    assert response == {"id": 1, "result": {"value": 4}}
+
+
+def test_send_command_decodes_lone_surrogates(decoder):
+    """An event carrying a lone surrogate must not lose the following reply."""
+    client = ChromeDevToolsClient()
+    client.connected = True
+    client.ws = FakeWebSocket(
+        [
+            {
+                "method": "Runtime.consoleAPICalled",
+                "params": {"args": [{"type": "string", "value": "\ud800"}]},
+            },
+            {"id": 1, "result": {"value": 4}},
+        ]
+    )
+
+    response = client._send_command("Runtime.evaluate", {"expression": "2 + 2"})
+
+    assert response == {"id": 1, "result": {"value": 4}}
+
+
+def test_send_command_uses_unique_ids():
+    """Each command gets a fresh message id."""
+    client = ChromeDevToolsClient()
+    client.connected = True
+    client.ws = FakeWebSocket([{"id": 1, "result": {}}, {"id": 2, "result": {}}])
+
+    client._send_command("Page.enable", {})
+    client._send_command("DOM.enable", {})
+
+    assert [command["id"] for command in client.ws.sent] == [1, 2]
+
+
+class EchoWebSocket(FakeWebSocket):
+    """Answers every command, preceded by an event, like a live tab."""
+
+    def __init__(self):
+        super().__init__([])
+        self.frames = queue.Queue()
+        self.timeout = None
+
+    def settimeout(self, timeout):
+        self.timeout = timeout
+
+    def send(self, payload):
+        command = json.loads(payload)
+        self.sent.append(command)
+        self.frames.put({"method": "Runtime.consoleAPICalled", "params": {}})
+        self.frames.put({"id": command["id"], "result": {"method": command["method"]}})
+
+    def recv(self):
+        # Yield so another thread's command can interleave with this one
+        time.sleep(0.01)
+        return json.dumps(self.frames.get(timeout=self.timeout))
+
+
+@pytest.mark.asyncio
+async def test_async_send_command_returns_result_payload():
+    """The async wrapper unwraps the reply down to its result."""
+    client = ChromeDevToolsClient()
+    client.connected = True
+    client.ws = FakeWebSocket([{"id": 1, "result": {"root": {"nodeId": 1}}}])
+
+    result = await client.send_command("DOM.getDocument", {"depth": 2})
+
+    assert result == {"root": {"nodeId": 1}}
+    assert client.ws.sent[0]["params"] == {"depth": 2}
+
+
+@pytest.mark.asyncio
+async def test_async_send_command_raises_on_protocol_error():
+    """CDP errors surface as exceptions instead of a missing result."""
+    client = ChromeDevToolsClient()
+    client.connected = True
+    client.ws = FakeWebSocket(
+        [{"id": 1, "error": {"code": -32000, "message": "CSS agent was not enabled"}}]
+    )
+
+    with pytest.raises(RuntimeError, match="CSS agent was not enabled"):
+        await client.send_command("CSS.getMediaQueries")
+    assert client.ws.sent[0]["params"] == {}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_send_commands_each_get_their_reply():
+    """Concurrent callers don't consume each other's replies."""
+    client = ChromeDevToolsClient()
+    client.connected = True
+    client.ws = EchoWebSocket()
+    methods = ["Page.enable", "DOM.enable", "Runtime.enable", "CSS.enable"]
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*(client.send_command(m) for m in methods)), timeout=5
+    )
+
+    assert [r["method"] for r in results] == methods
+    assert sorted(c["id"] for c in client.ws.sent) == [1, 2, 3, 4]
+
+
+def test_send_command_gives_up_after_timeout():
+    """A reply that never arrives returns None once the deadline passes."""
+    client = ChromeDevToolsClient()
+    client.connected = True
+    event = {"method": "Network.dataReceived", "params": {}}
+    # Finite, so a missing deadline fails the elapsed check instead of hanging
+    client.ws = FakeWebSocket(itertools.repeat(event, 300), delay=0.01)
+
+    start = time.monotonic()
+    response = client._send_command("Runtime.evaluate", {}, timeout=0.2)
+    elapsed = time.monotonic() - start
+
+    assert response is None
+    assert elapsed < 1.0, f"Command waited {elapsed:.2f}s for a 0.2s timeout"
+    assert all(0 < t <= 0.2 for t in client.ws.timeouts)
+
+
+def test_connect_bounds_discovery_and_socket_waits(monkeypatch):
+    """Tab discovery and the websocket both get explicit timeouts."""
+    calls = {}
+
+    class FakeResponse:
+        def json(self):
+            return [{"webSocketDebuggerUrl": "ws://localhost:9222/devtools/page/1"}]
+
+    def fake_get(url, **kwargs):
+        calls["get"] = kwargs
+        return FakeResponse()
+
+    def fake_create_connection(url, **kwargs):
+        calls["create_connection"] = kwargs
+        return FakeWebSocket([{"id": i, "result": {}} for i in (1, 2, 3)])
+
+    monkeypatch.setattr(client_module.requests, "get", fake_get)
+    monkeypatch.setattr(
+        client_module.websocket, "create_connection", fake_create_connection
+    )
+
+    assert ChromeDevToolsClient().connect(9222)
+    assert calls["get"]["timeout"] == client_module.HTTP_TIMEOUT
+    assert calls["create_connection"]["timeout"] == client_module.COMMAND_TIMEOUT
@@ -1,9 +1,11 @@
 """Test core import and export functionality."""
 
+import ast
 import pytest
 import sys
 import subprocess
 import os
+from pathlib import Path
 
 
 def test_server_entry_point_imports():
@@ -46,36 +48,26 @@ def test_no_relative_imports():
 
     package_dir = os.path.dirname(chrome_devtools_mcp_fork.__file__)
 
-    # Check all Python files for relative imports
-    relative_import_patterns = ["from .", "from .."]
     found_relative_imports = []
 
-    for root, dirs, files in os.walk(package_dir):
+    for filepath in Path(package_dir).rglob("*.py"):
         # Skip __pycache__ directories
-        dirs[:] = [d for d in dirs if d != "__pycache__"]
-
-        for file in files:
-            if file.endswith(".py"):
-                filepath = os.path.join(root, file)
-                with open(filepath, "r") as f:
-                    content = f.read()
-                    for line_num, line in enumerate(content.splitlines(), 1):
-                        for pattern in relative_import_patterns:
-                            if pattern in line and not line.strip().startswith("#"):
-                                found_relative_imports.append(
-                                    f"{filepath}:{line_num}: {line.strip()}"
-                                )
+        if "__pycache__" in filepath.parts:
+            continue
+
+        tree = ast.parse(filepath.read_bytes(), filename=str(filepath))
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ImportFrom) and node.level > 0:
+                found_relative_imports.append(f"{filepath}:{node.lineno}")
 
     assert not found_relative_imports, "Found relative imports:\n" + "\n".join(
         found_relative_imports
     )
 
 
-def test_server_py_import_in_subprocess():
+@pytest.mark.slow
+def test_server_py_import_in_subprocess(project_root):
     """Test that server.py can be imported in a subprocess (simulates MCP execution)."""
-    # Get the project root directory
-    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-
     # Python code to test imports
     test_code = """
 import sys
@@ -96,11 +88,9 @@ print("SUCCESS: All imports worked")
     assert "SUCCESS: All imports worked" in result.stdout
 
 
-def test_main_module_execution():
+@pytest.mark.slow
+def test_main_module_execution(project_root):
     """Test the package can be executed as a module."""
-    # Get the project root directory
-    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-
     # Test running as module
     test_code = """
 import sys
@@ -1,29 +1,11 @@
 """Test PyPI deployment readiness and package distribution."""
 
 import pytest
-import subprocess
-import sys
 import os
-import tempfile
 
 
-def test_package_metadata():
+def test_package_metadata(pyproject):
     """Verify setup.py/pyproject.toml correctness."""
-    # Check pyproject.toml exists
-    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    pyproject_path = os.path.join(project_root, "pyproject.toml")
-
-    assert os.path.exists(pyproject_path), "pyproject.toml not found"
-
-    # Read pyproject.toml - handle Python 3.10 compatibility
-    try:
-        import tomllib
-    except ImportError:
-        import tomli as tomllib
-
-    with open(pyproject_path, "rb") as f:
-        pyproject = tomllib.load(f)
-
     # Check required fields
     assert "project" in pyproject, "Missing [project] section"
     project = pyproject["project"]
@@ -50,7 +32,7 @@ def test_package_metadata():
     )
 
 
-def test_version_consistency():
+def test_version_consistency(pyproject):
     """Test version is consistent across files."""
     import chrome_devtools_mcp_fork
 
@@ -61,65 +43,27 @@ def test_version_consistency():
     )
 
     # Check against pyproject.toml
-    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    pyproject_path = os.path.join(project_root, "pyproject.toml")
-
-    try:
-        import tomllib
-    except ImportError:
-        import tomli as tomllib
-
-    with open(pyproject_path, "rb") as f:
-        pyproject = tomllib.load(f)
-
     pyproject_version = pyproject["project"]["version"]
     assert chrome_devtools_mcp_fork.__version__ == pyproject_version, (
         f"Version mismatch: __init__.py={chrome_devtools_mcp_fork.__version__}, pyproject.toml={pyproject_version}"
     )
 
 
-def test_build_package():
+@pytest.mark.slow
+def test_build_package(built_dist):
     """Test that package builds successfully."""
-    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-
-    # Create a temporary directory for build artifacts
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Try to build the package
-        result = subprocess.run(
-            [sys.executable, "-m", "build", "--outdir", temp_dir],
-            cwd=project_root,
-            capture_output=True,
-            text=True,
-        )
-
-        if result.returncode != 0:
-            # If build module not installed, skip test
-            if "No module named build" in result.stderr:
-                pytest.skip("build module not installed")
-            else:
-                pytest.fail(f"Package build failed: {result.stderr}")
-
-        # Check that wheel and sdist were created
-        files = os.listdir(temp_dir)
-        wheel_files = [f for f in files if f.endswith(".whl")]
-        sdist_files = [f for f in files if f.endswith(".tar.gz")]
-
-        assert len(wheel_files) == 1, f"Expected 1 wheel file, found {len(wheel_files)}"
-        assert len(sdist_files) == 1, f"Expected 1 sdist file, found {len(sdist_files)}"
-
-
-def test_entry_points():
-    """Test that console scripts/entry points are configured."""
-    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    pyproject_path = os.path.join(project_root, "pyproject.toml")
+    # Check that wheel and sdist were created
+    files = os.listdir(built_dist)
+    wheel_files = [f for f in files if f.endswith(".whl")]
+    sdist_files = [f for f in files if f.endswith(".tar.gz")]
 
-    try:
-        import tomllib
-    except ImportError:
-        import tomli as tomllib
+    assert len(wheel_files) == 1, f"Expected 1 wheel file, found {len(wheel_files)}"
+    assert len(sdist_files) == 1, f"Expected 1 sdist file, found {len(sdist_files)}"
 
-    with open(pyproject_path, "rb") as f:
-        _ = tomllib.load(f)  # Just verify it loads correctly
+
+def test_entry_points(pyproject):
+    """Test that console scripts/entry points are configured."""
+    assert "project" in pyproject  # Just verify it loads correctly
 
     # Check for MCP server configuration
     # Note: MCP servers typically don't have console scripts but are run via server.py
@@ -132,31 +76,18 @@ def test_entry_points():
 
 
 def test_importable_after_install():
-    """Test package can be imported in clean environment."""
-    # This test simulates what happens after pip install
-    test_script = """
-import sys
-import chrome_devtools_mcp_fork
-
-# Test basic imports
-assert hasattr(chrome_devtools_mcp_fork, '__version__')
-assert hasattr(chrome_devtools_mcp_fork, 'main')
-assert hasattr(chrome_devtools_mcp_fork, 'app')
-assert hasattr(chrome_devtools_mcp_fork, 'get_mcp_server')
-
-# Test getting MCP server
-mcp = chrome_devtools_mcp_fork.get_mcp_server()
-assert mcp is not None
-
-print("SUCCESS: Package imports work correctly")
-"""
-
-    result = subprocess.run(
-        [sys.executable, "-c", test_script], capture_output=True, text=True
-    )
+    """Test package exposes its public API after install."""
+    import chrome_devtools_mcp_fork
 
-    assert result.returncode == 0, f"Import test failed: {result.stderr}"
-    assert "SUCCESS" in result.stdout
+    # Test basic imports
+    assert hasattr(chrome_devtools_mcp_fork, "__version__")
+    assert hasattr(chrome_devtools_mcp_fork, "main")
+    assert hasattr(chrome_devtools_mcp_fork, "app")
+    assert hasattr(chrome_devtools_mcp_fork, "get_mcp_server")
+
+    # Test getting MCP server
+    mcp = chrome_devtools_mcp_fork.get_mcp_server()
+    assert mcp is not None
 
 
 def test_no_missing_files():
@@ -165,41 +96,32 @@ def test_no_missing_files():
 
     package_dir = os.path.dirname(chrome_devtools_mcp_fork.__file__)
 
-    # Check that all expected modules exist
-    expected_files = [
-        "__init__.py",
-        "main.py",
-        "client.py",
-        "tools/__init__.py",
-        "tools/browser.py",
-        "tools/console.py",
-        "tools/css.py",
-        "tools/dom.py",
-        "tools/network.py",
-        "tools/performance.py",
-        "tools/storage.py",
-        "utils/__init__.py",
-        "utils/helpers.py",
-    ]
-
-    for file_path in expected_files:
-        full_path = os.path.join(package_dir, file_path)
-        assert os.path.exists(full_path), f"Missing file: {file_path}"
-
-
-def test_dependency_versions():
+    # Check that all expected modules exist, grouped by directory so each
+    # directory is listed once
+    expected_files = {
+        "": ["__init__.py", "main.py", "client.py"],
+        "tools": [
+            "__init__.py",
+            "browser.py",
+            "console.py",
+            "css.py",
+            "dom.py",
+            "network.py",
+            "performance.py",
+            "storage.py",
+        ],
+        "utils": ["__init__.py", "helpers.py"],
+    }
+
+    for subdir, file_names in expected_files.items():
+        present = set(os.listdir(os.path.join(package_dir, subdir)))
+        for file_name in file_names:
+            file_path = f"{subdir}/{file_name}" if subdir else file_name
+            assert file_name in present, f"Missing file: {file_path}"
+
+
+def test_dependency_versions(pyproject):
     """Test that dependency versions are appropriate."""
-    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    pyproject_path = os.path.join(project_root, "pyproject.toml")
-
-    try:
-        import tomllib
-    except ImportError:
-        import tomli as tomllib
-
-    with open(pyproject_path, "rb") as f:
-        pyproject = tomllib.load(f)
-
     deps = pyproject["project"]["dependencies"]
 
     # Check each dependency has appropriate version constraints
@@ -2,17 +2,27 @@
 
 import pytest
 import json
-import sys
-from io import StringIO
-from chrome_devtools_mcp_fork.main import app
 
+from chrome_devtools_mcp_fork.utils.helpers import (
+    create_success_response,
+    create_error_response,
+)
+
+# Known parameter types from our implementation; optional parameters are
+# rendered as anyOf and compared as a set of type names
+EXPECTED_PARAM_TYPES = {
+    "port": "integer",
+    "headless": "boolean",
+    "chrome_path": frozenset({"string", "null"}),
+    "url": "string",
+    "depth": "integer",
+    "node_id": "integer",
+}
 
-@pytest.mark.asyncio
-async def test_tool_schema_validation():
-    """Validate all tools have proper MCP schemas."""
-    tools = await app.list_tools()
 
-    for tool in tools:
+def test_tool_schema_validation(all_tools):
+    """Validate all tools have proper MCP schemas."""
+    for tool in all_tools:
         # Check required attributes
         assert hasattr(tool, "name"), "Tool missing name attribute"
         assert hasattr(tool, "description"), f"Tool {tool.name} missing description"
@@ -51,24 +61,14 @@ async def test_tool_schema_validation():
             )
 
 
-def test_stdio_transport_no_stdout():
+def test_stdio_transport_no_stdout(capsys, reimport_package):
     """Test that MCP server doesn't write to stdout (only stderr for logs)."""
-    # Capture stdout
-    old_stdout = sys.stdout
-    captured_stdout = StringIO()
-    sys.stdout = captured_stdout
-
-    try:
-        # Import should not print to stdout
-
-        # Get stdout content
-        stdout_content = captured_stdout.getvalue()
-
-        # Should be empty (MCP servers must not write to stdout)
-        assert stdout_content == "", f"Server wrote to stdout: {stdout_content}"
+    # Import should not print to stdout
+    reimport_package()
 
-    finally:
-        sys.stdout = old_stdout
+    # Should be empty (MCP servers must not write to stdout)
+    stdout_content = capsys.readouterr().out
+    assert stdout_content == "", f"Server wrote to stdout: {stdout_content}"
 
 
 def test_error_response_format():
@@ -110,12 +110,9 @@ def test_success_response_format():
     assert success2["data"] is None, "Data should be None when not provided"
 
 
-@pytest.mark.asyncio
-async def test_tool_descriptions():
+def test_tool_descriptions(all_tools):
     """Ensure all tools have meaningful descriptions."""
-    tools = await app.list_tools()
-
-    for tool in tools:
+    for tool in all_tools:
         # Description should exist and be meaningful
         assert tool.description, f"Tool {tool.name} has empty description"
         assert len(tool.description) > 10, f"Tool {tool.name} description too short"
@@ -127,62 +124,44 @@ async def test_tool_descriptions():
         )
 
 
-def test_json_serializable_responses():
-    """Test that all response formats are JSON serializable."""
-    from chrome_devtools_mcp_fork.utils.helpers import (
-        create_success_response,
-        create_error_response,
-    )
-
-    # Test various response types
-    responses = [
+@pytest.mark.parametrize(
+    "response",
+    [
         create_success_response(None),
         create_success_response("string data"),
         create_success_response({"key": "value"}),
         create_success_response([1, 2, 3]),
         create_error_response("Error message"),
         create_error_response("Error", {"code": 404}),
-    ]
-
-    for response in responses:
-        try:
-            json_str = json.dumps(response)
-            assert json_str, "Response should serialize to non-empty JSON"
+    ],
+)
+def test_json_serializable_responses(response):
+    """Test that all response formats are JSON serializable."""
+    try:
+        json_str = json.dumps(response)
+        assert json_str, "Response should serialize to non-empty JSON"
 
-            # Should be able to parse back
-            parsed = json.loads(json_str)
-            assert isinstance(parsed, dict), "Parsed response should be dict"
+        # Should be able to parse back
+        parsed = json.loads(json_str)
+        assert isinstance(parsed, dict), "Parsed response should be dict"
 
-        except (TypeError, ValueError) as e:
-            pytest.fail(f"Response not JSON serializable: {e}")
+    except (TypeError, ValueError) as e:
+        pytest.fail(f"Response not JSON serializable: {e}")
 
 
-@pytest.mark.asyncio
-async def test_parameter_types():
+def test_parameter_types(all_tools):
     """Verify parameter types match Python type hints."""
-    tools = await app.list_tools()
-
-    # Known parameter types from our implementation
-    expected_types = {
-        "port": "integer",
-        "headless": "boolean",
-        "chrome_path": ["string", "null"],
-        "url": "string",
-        "depth": "integer",
-        "node_id": "integer",
-    }
-
-    for tool in tools:
+    for tool in all_tools:
         if "properties" in tool.inputSchema:
             for param_name, param_def in tool.inputSchema["properties"].items():
-                if param_name in expected_types:
+                if param_name in EXPECTED_PARAM_TYPES:
                     param_type = param_def.get("type")
-                    expected = expected_types[param_name]
+                    expected = EXPECTED_PARAM_TYPES[param_name]
 
                     # Handle anyOf for optional parameters
                     if "anyOf" in param_def:
-                        types = [t.get("type") for t in param_def["anyOf"]]
-                        assert set(types) == set(expected), (
+                        types = frozenset(t.get("type") for t in param_def["anyOf"])
+                        assert types == expected, (
                             f"Tool {tool.name} param {param_name} type mismatch"
                         )
                     else:
@@ -3,165 +3,146 @@
 import pytest
 import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch, MagicMock
 import asyncio
 
 
-def test_tool_registration_speed():
-    """Ensure fast startup for subprocess execution."""
-    # Test script that imports and registers all tools
-    test_script = """
-import time
-start = time.time()
-
-# Import and create app
-from chrome_devtools_mcp_fork.main import app
-
-# Measure import time
-import_time = time.time() - start
-print(f"Import time: {import_time:.3f}s")
+# Injection attempts for the chrome_path parameter
+DANGEROUS_PATHS = [
+    "/bin/sh; rm -rf /",  # Command injection
+    "../../../../../../bin/sh",  # Path traversal
+    "|echo hacked",  # Pipe injection
+    "$(whoami)",  # Command substitution
+    "`id`",  # Backtick injection
+    "chrome && malicious_command",  # Command chaining
+    "chrome || malicious_command",  # Command chaining
+    "chrome; malicious_command",  # Command separator
+]
 
-# List tools to ensure registration completed
-import asyncio
-tools = asyncio.run(app.list_tools())
-total_time = time.time() - start
-print(f"Total time: {total_time:.3f}s")
-print(f"Tool count: {len(tools)}")
-"""
 
-    result = subprocess.run(
-        [sys.executable, "-c", test_script], capture_output=True, text=True
+@pytest.mark.timing
+def test_tool_registration_speed():
+    """Ensure registering and listing all tools is fast."""
+    from mcp.server.fastmcp import FastMCP
+    from chrome_devtools_mcp_fork.tools import (
+        browser,
+        console,
+        css,
+        dom,
+        network,
+        performance,
+        storage,
     )
 
-    assert result.returncode == 0, f"Script failed: {result.stderr}"
+    start = time.perf_counter()
 
-    # Parse output
-    lines = result.stdout.strip().split("\n")
-    for line in lines:
-        if "Total time:" in line:
-            total_time = float(line.split(":")[1].strip().rstrip("s"))
-            # Should be under 3 seconds (relaxed for CI environment)
-            assert total_time < 3.0, f"Startup too slow: {total_time}s"
-            break
-    else:
-        pytest.fail("Could not find timing information in output")
+    test_app = FastMCP("test-registration")
+    for module in (browser, console, css, dom, network, performance, storage):
+        module.register_tools(test_app)
+    tools = asyncio.run(test_app.list_tools())
 
+    total_time = time.perf_counter() - start
+    assert tools, "No tools registered"
+    # Should be under 3 seconds (relaxed for CI environment)
+    assert total_time < 3.0, f"Startup too slow: {total_time}s"
 
-def test_chrome_path_injection_prevention():
-    """Test security of chrome_path parameter."""
-    from chrome_devtools_mcp_fork.tools import browser
-    from mcp.server.fastmcp import FastMCP
 
-    # Create test app
-    test_app = FastMCP("test-security")
-    browser.register_tools(test_app)
-
-    # Verify tools are registered (we don't need the specific tool for this test)
-    _ = asyncio.run(test_app.list_tools())
-
-    # Test various injection attempts
-    dangerous_paths = [
-        "/bin/sh; rm -rf /",  # Command injection
-        "../../../../../../bin/sh",  # Path traversal
-        "|echo hacked",  # Pipe injection
-        "$(whoami)",  # Command substitution
-        "`id`",  # Backtick injection
-        "chrome && malicious_command",  # Command chaining
-        "chrome || malicious_command",  # Command chaining
-        "chrome; malicious_command",  # Command separator
-    ]
-
-    # Mock subprocess to prevent actual execution
-    with patch("subprocess.Popen") as mock_popen:
+@pytest.fixture
+def mock_popen():
+    """Stub out Chrome's launch so start_chrome can be called safely.
+
+    Popen is mocked to prevent actual execution, and the profile directory
+    and startup wait are skipped.
+    """
+    with (
+        patch("subprocess.Popen") as mock_popen,
+        patch("tempfile.mkdtemp", return_value="/tmp/chrome-mcp-test"),
+        patch("time.sleep"),
+    ):
         mock_process = MagicMock()
         mock_process.pid = 12345
         mock_popen.return_value = mock_process
+        yield mock_popen
 
-        for dangerous_path in dangerous_paths:
-            # Call should complete without executing injected commands
-            # The function should either sanitize or fail safely
-            try:
-                # Get the actual function implementation
-                # Since FastMCP wraps functions, we need to call through the app
-                # This is a simplified test - in production you'd test the actual MCP call
-                pass  # Tool execution would happen through MCP protocol
-            except Exception:
-                # Failing is acceptable for dangerous input
-                pass
-
-            # Verify subprocess was called with safe arguments
-            if mock_popen.called:
-                # Get the command that would have been executed
-                call_args = mock_popen.call_args[0][0]
-
-                # Ensure no dangerous patterns in actual command
-                command_str = " ".join(call_args)
-                assert ";" not in command_str or dangerous_path == call_args[0], (
-                    "Command separator not properly handled"
-                )
-                assert "|" not in command_str or dangerous_path == call_args[0], (
-                    "Pipe not properly handled"
-                )
-                assert "$(" not in command_str, "Command substitution not prevented"
-                assert "`" not in command_str, "Backtick injection not prevented"
-
-
-def test_no_sensitive_data_logging():
-    """Ensure no sensitive data is logged to stdout."""
-    # Test that the server doesn't log sensitive information
-    test_script = """
-import sys
-from io import StringIO
 
-# Capture any print statements
-old_stdout = sys.stdout
-captured = StringIO()
-sys.stdout = captured
+@pytest.mark.asyncio
+@pytest.mark.parametrize("dangerous_path", DANGEROUS_PATHS)
+async def test_chrome_path_injection_prevention(all_tools, mock_popen, dangerous_path):
+    """Test security of chrome_path parameter."""
+    from chrome_devtools_mcp_fork.main import app
 
-# Import the package
-import chrome_devtools_mcp_fork
+    # Verify the tool is registered on the shared app
+    start_chrome_tool = next(t for t in all_tools if t.name == "start_chrome")
+    assert "chrome_path" in start_chrome_tool.inputSchema["properties"]
 
-# Restore stdout
-sys.stdout = old_stdout
-output = captured.getvalue()
+    # Call through the app, the same way the MCP protocol does
+    await app.call_tool("start_chrome", {"chrome_path": dangerous_path})
 
-# Check for sensitive patterns
-sensitive_patterns = ['password', 'secret', 'token', 'key', 'credential']
-for pattern in sensitive_patterns:
-    if pattern.lower() in output.lower():
-        print(f"FAIL: Found sensitive pattern '{pattern}' in output")
-        sys.exit(1)
+    assert mock_popen.called, "start_chrome should launch Chrome"
+    args, kwargs = mock_popen.call_args
 
-print("PASS: No sensitive data in output")
-"""
+    # The path must reach the OS as a single argv entry, never via a shell
+    assert isinstance(args[0], list), "Command must be an argument list"
+    assert args[0][0] == dangerous_path, "chrome_path must be passed verbatim"
+    assert not kwargs.get("shell"), "Chrome must not be started through a shell"
 
-    result = subprocess.run(
-        [sys.executable, "-c", test_script], capture_output=True, text=True
+
+@pytest.mark.asyncio
+async def test_start_chrome_passes_explicit_bufsize(mock_popen):
+    """start_chrome spells out bufsize=-1 rather than relying on the default."""
+    from chrome_devtools_mcp_fork.main import app
+
+    await app.call_tool("start_chrome", {})
+
+    # Chrome's output goes to DEVNULL, so this is an explicit-argument
+    # contract rather than a buffering requirement
+    assert mock_popen.call_args.kwargs.get("bufsize") == -1, (
+        "Popen must be passed bufsize=-1 explicitly"
     )
 
-    assert result.returncode == 0, f"Sensitive data check failed: {result.stdout}"
-    assert "PASS" in result.stdout
+
+def test_no_sensitive_data_logging(capsys, reimport_package):
+    """Ensure no sensitive data is logged to stdout."""
+    # Test that importing the package doesn't log sensitive information
+    reimport_package()
+    output = capsys.readouterr().out.lower()
+
+    # Check for sensitive patterns
+    for pattern in ["password", "secret", "token", "key", "credential"]:
+        assert pattern not in output, f"Found sensitive pattern '{pattern}' in output"
 
 
-def test_resource_cleanup():
+def test_resource_cleanup(monkeypatch):
     """Test that resources are properly cleaned up."""
     # This tests that Chrome client connections are cleaned up
+    from chrome_devtools_mcp_fork import client as client_module
     from chrome_devtools_mcp_fork.client import ChromeDevToolsClient
 
+    # Refuse every discovery request, so a Chrome a developer has running on
+    # the default port is never attached to
+    requested = []
+
+    def refuse(url, **kwargs):
+        requested.append(url)
+        raise client_module.requests.ConnectionError(f"refused: {url}")
+
+    monkeypatch.setattr(client_module.requests, "get", refuse)
+
     # Create multiple clients
-    clients = []
-    for i in range(5):
-        client = ChromeDevToolsClient()
-        clients.append(client)
+    clients = [ChromeDevToolsClient() for _ in range(5)]
+    ports = range(9222, 9222 + len(clients))  # Different ports
 
-    # Simulate connections (they'll fail but that's ok)
-    for client in clients:
-        client.connect(9222 + i)  # Different ports
+    # Simulate connections concurrently (they'll fail but that's ok)
+    with ThreadPoolExecutor(max_workers=len(clients)) as executor:
+        list(executor.map(ChromeDevToolsClient.connect, clients, ports))
+    assert len(requested) == len(clients)
 
     # Check that clients can be garbage collected
     # In a real scenario, we'd check WebSocket cleanup
     assert all(not c.is_connected() for c in clients), (
-        "Clients should not be connected (no Chrome running)"
+        "Clients should not be connected (discovery refused)"
     )
 
     # Clear references
@@ -171,45 +152,23 @@ def test_resource_cleanup():
     # and temporary directories are cleaned up
 
 
-def test_concurrent_tool_execution():
+@pytest.mark.asyncio
+async def test_concurrent_tool_execution():
     """Test that tools can handle concurrent execution safely."""
-    # Test script for concurrent execution
-    test_script = """
-import asyncio
-from chrome_devtools_mcp_fork.main import app
-
-async def test_concurrent():
-    # Get tools
-    tools = await app.list_tools()
-    
-    # Find get_connection_status (safe to call multiple times)
-    status_tool = next(t for t in tools if t.name == 'get_connection_status')
-    
-    # This is a simplified test - in real MCP, tools are called through protocol
-    # Here we just verify the app can handle multiple tool listings
-    tasks = []
-    for i in range(10):
-        tasks.append(app.list_tools())
-    
-    results = await asyncio.gather(*tasks)
-    
-    # All should return the same tool count
-    tool_counts = [len(r) for r in results]
-    assert len(set(tool_counts)) == 1, "Inconsistent tool counts"
-    
-    print(f"PASS: Handled {len(tasks)} concurrent operations")
+    from chrome_devtools_mcp_fork.main import app
 
-asyncio.run(test_concurrent())
-"""
-
-    result = subprocess.run(
-        [sys.executable, "-c", test_script], capture_output=True, text=True
-    )
+    # This is a simplified test - in real MCP, tools are called through protocol
+    # Here we just verify the app can handle multiple tool listings.
+    # gather rather than TaskGroup, which needs Python 3.11+
+    results = await asyncio.gather(*(app.list_tools() for _ in range(10)))
 
-    assert result.returncode == 0, f"Concurrent test failed: {result.stderr}"
-    assert "PASS" in result.stdout
+    # All should return the same tool count
+    tool_counts = {len(r) for r in results}
+    assert len(tool_counts) == 1, "Inconsistent tool counts"
 
 
+@pytest.mark.slow
+@pytest.mark.timing
 def test_import_time_overhead():
     """Measure import time overhead after moving imports inside functions."""
     # Test the import time difference